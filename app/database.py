@@ -10,6 +10,7 @@ Models:
 - Project: Funded research projects
 - PublicationAuthor: Many-to-many relationship
 - ProjectPublisher: Research output from projects
+- OrcidSearchNegative: Cache of names with no ORCID match
 """
 
 from datetime import datetime
@@ -299,6 +300,21 @@ class HarvestLog(Base):
         return f"<HarvestLog {self.source} @ {self.started_at}>"
 
 
+class OrcidSearchNegative(Base):
+    """
+    Researcher names whose ORCID search returned no match.
+    Lets enrichment re-runs skip names that were recently checked.
+    """
+
+    __tablename__ = "orcid_search_negative"
+
+    name_hash = Column(String, primary_key=True)  # sha1 of normalized name
+    last_checked = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<OrcidSearchNegative {self.name_hash} @ {self.last_checked}>"
+
+
 def init_db():
     """Initialize database with all tables."""
     print("Creating database tables...")
@@ -312,6 +328,31 @@ def init_db():
         print("✓ Database connection established")
 
 
+def bulk_insert_ignore(db, model, rows: List[dict]) -> List[str]:
+    """
+    Insert many rows in one statement, skipping rows that hit a unique/PK conflict.
+
+    Args:
+        db: Database session
+        model: ORM model class with an `id` primary key
+        rows: Column dicts, all with the same keys
+
+    Returns:
+        Primary keys of the rows actually inserted
+    """
+    if not rows:
+        return []
+
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    table = model.__table__
+    stmt = insert(table).values(rows).on_conflict_do_nothing().returning(table.c.id)
+    return list(db.execute(stmt).scalars())
+
+
 def get_db():
     """Dependency for FastAPI to get database session."""
     db = SessionLocal()
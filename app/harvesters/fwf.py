@@ -25,7 +25,14 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 import logging
 
-from app.database import SessionLocal, Project, Publication, Organization, HarvestLog
+from app.database import (
+    SessionLocal,
+    Project,
+    Publication,
+    Organization,
+    HarvestLog,
+    bulk_insert_ignore,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,7 @@ logger = logging.getLogger(__name__)
 FWF_API_BASE = "https://elise.fwf.ac.at/api"
 FWF_TIMEOUT = 30.0
 FWF_PAGE_SIZE = 100
+BULK_INSERT_SIZE = 1000  # rows per INSERT ... ON CONFLICT DO NOTHING in bulk mode
 
 
 class FWFHarvester:
@@ -41,14 +49,17 @@ class FWFHarvester:
     Integrates funding information with publications for impact assessment.
     """
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, bulk: bool = False):
         """
         Initialize FWF harvester.
 
         Args:
             timeout: HTTP request timeout in seconds
+            bulk: Buffer projects and insert them in batches, letting the
+                database skip duplicate grant numbers instead of checking row by row
         """
         self.timeout = timeout
+        self.bulk = bulk
         self.user_agent = "ARMP/1.0 (FWF Project Harvester)"
 
     async def harvest_all(self, max_records: Optional[int] = None) -> Dict[str, Any]:
@@ -82,6 +93,8 @@ class FWFHarvester:
             db.add(harvest_log)
             db.commit()
 
+            pending: List[Dict[str, Any]] = []
+
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 offset = 0
 
@@ -103,23 +116,29 @@ class FWFHarvester:
                         stats["total_fetched"] += len(projects)
 
                         # Store projects
-                        for proj_data in projects:
-                            try:
-                                stored = await self._store_project(db, proj_data)
-                                if stored:
-                                    stats["total_stored"] += 1
-
-                                    # Try to link to publications
-                                    linked = self._link_to_publications(
-                                        db, proj_data
-                                    )
-                                    stats["linked_to_publications"] += linked
-                                else:
-                                    stats["duplicates"] += 1
-
-                            except Exception as e:
-                                logger.warning(f"Error storing project: {e}")
-                                stats["errors"] += 1
+                        if self.bulk:
+                            pending.extend(projects)
+                            if len(pending) >= BULK_INSERT_SIZE:
+                                self._store_projects_bulk(db, pending, stats)
+                                pending = []
+                        else:
+                            for proj_data in projects:
+                                try:
+                                    stored = await self._store_project(db, proj_data)
+                                    if stored:
+                                        stats["total_stored"] += 1
+
+                                        # Try to link to publications
+                                        linked = self._link_to_publications(
+                                            db, proj_data
+                                        )
+                                        stats["linked_to_publications"] += linked
+                                    else:
+                                        stats["duplicates"] += 1
+
+                                except Exception as e:
+                                    logger.warning(f"Error storing project: {e}")
+                                    stats["errors"] += 1
 
                         logger.info(
                             f"FWF: Fetched {stats['total_fetched']}, "
@@ -136,6 +155,9 @@ class FWFHarvester:
                         stats["errors"] += 1
                         break
 
+            if pending:
+                self._store_projects_bulk(db, pending, stats)
+
             # Update harvest log
             harvest_log.status = "completed"
             harvest_log.record_count = stats["total_stored"]
@@ -275,6 +297,78 @@ class FWFHarvester:
             "metadata": item,
         }
 
+    def _project_row(self, proj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map normalized project data to Project column values.
+
+        Args:
+            proj_data: Normalized project data
+
+        Returns:
+            Column name to value dictionary
+        """
+        return {
+            "id": proj_data.get("id"),
+            "grant_number": proj_data.get("grant_number"),
+            "title": proj_data.get("title"),
+            "abstract": proj_data.get("abstract"),
+            "funder": "FWF",
+            "funder_id": "fwf",
+            "funding_amount": proj_data.get("funding_amount"),
+            "currency": proj_data.get("currency", "EUR"),
+            "start_date": proj_data.get("start_date"),
+            "end_date": proj_data.get("end_date"),
+            "principal_investigator": proj_data.get("principal_investigator"),
+            "investigators": proj_data.get("investigators"),
+            "classification": proj_data.get("classification"),
+            "keywords": proj_data.get("keywords"),
+            "source_system": "fwf",
+            "external_url": proj_data.get("external_url"),
+        }
+
+    def _store_projects_bulk(
+        self, db, projects: List[Dict[str, Any]], stats: Dict[str, Any]
+    ) -> None:
+        """
+        Store a batch of projects with a single INSERT ... ON CONFLICT DO NOTHING,
+        then link only the newly inserted projects to publications.
+
+        Args:
+            db: Database session
+            projects: Normalized project data
+            stats: Statistics dictionary to update
+        """
+        # grant_number is NOT NULL; these rows would fail the whole statement
+        rows = []
+        for proj_data in projects:
+            if proj_data.get("grant_number"):
+                rows.append(self._project_row(proj_data))
+            else:
+                stats["errors"] += 1
+
+        try:
+            inserted = set(bulk_insert_ignore(db, Project, rows))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error bulk storing {len(rows)} projects: {e}")
+            stats["errors"] += len(rows)
+            return
+
+        stats["total_stored"] += len(inserted)
+        stats["duplicates"] += len(rows) - len(inserted)
+
+        for proj_data in projects:
+            if proj_data.get("id") in inserted:
+                try:
+                    stats["linked_to_publications"] += self._link_to_publications(
+                        db, proj_data
+                    )
+                except Exception as e:
+                    db.rollback()
+                    logger.warning(f"Error linking project {proj_data['id']}: {e}")
+                    stats["errors"] += 1
+
     async def _store_project(self, db, proj_data: Dict[str, Any]) -> bool:
         """
         Store normalized project in database.
@@ -296,24 +390,7 @@ class FWFHarvester:
                 return False
 
         # Create new project
-        project = Project(
-            id=proj_data.get("id"),
-            grant_number=proj_data.get("grant_number"),
-            title=proj_data.get("title"),
-            abstract=proj_data.get("abstract"),
-            funder="FWF",
-            funder_id="fwf",
-            funding_amount=proj_data.get("funding_amount"),
-            currency=proj_data.get("currency", "EUR"),
-            start_date=proj_data.get("start_date"),
-            end_date=proj_data.get("end_date"),
-            principal_investigator=proj_data.get("principal_investigator"),
-            investigators=proj_data.get("investigators"),
-            classification=proj_data.get("classification"),
-            keywords=proj_data.get("keywords"),
-            source_system="fwf",
-            external_url=proj_data.get("external_url"),
-        )
+        project = Project(**self._project_row(proj_data))
 
         db.add(project)
         db.commit()
@@ -360,14 +437,15 @@ class FWFHarvester:
         return linked
 
 
-async def harvest_fwf(max_records: Optional[int] = None):
+async def harvest_fwf(max_records: Optional[int] = None, bulk: bool = False):
     """
     Async wrapper for FWF harvesting.
 
     Args:
         max_records: Maximum projects to harvest
+        bulk: Use batched INSERT ... ON CONFLICT DO NOTHING
     """
-    harvester = FWFHarvester()
+    harvester = FWFHarvester(bulk=bulk)
     return await harvester.harvest_all(max_records)
 
 
@@ -15,11 +15,17 @@ import httpx
 import asyncio
 import json
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from pathlib import Path
 import logging
 
-from app.database import SessionLocal, Publication, Organization, HarvestLog
+from app.database import (
+    SessionLocal,
+    Publication,
+    Organization,
+    HarvestLog,
+    bulk_insert_ignore,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +33,10 @@ logger = logging.getLogger(__name__)
 OPENAIRE_API_BASE = "https://api.openaire.eu/graph"
 OPENAIRE_TIMEOUT = 30.0
 OPENAIRE_PAGE_SIZE = 100
+BULK_INSERT_SIZE = 1000  # rows per INSERT ... ON CONFLICT DO NOTHING in bulk mode
+
+# Called with (ror_id, org_name, stats) as soon as an organization finishes
+OrgStatsCallback = Callable[[str, str, Dict[str, Any]], None]
 
 # Austrian universities with ROR identifiers
 AUSTRIAN_UNIVERSITIES = {
@@ -54,16 +64,19 @@ class OpenAIREHarvester:
     Provides methods to query OpenAIRE and store results in database.
     """
 
-    def __init__(self, batch_size: int = 100, timeout: float = 30.0):
+    def __init__(self, batch_size: int = 100, timeout: float = 30.0, bulk: bool = False):
         """
         Initialize harvester.
 
         Args:
             batch_size: Number of records per API request
             timeout: HTTP request timeout in seconds
+            bulk: Buffer publications and insert them in batches, letting the
+                database skip duplicates instead of checking row by row
         """
         self.batch_size = batch_size
         self.timeout = timeout
+        self.bulk = bulk
         self.session = None
         self.harvest_log = None
 
@@ -118,6 +131,8 @@ class OpenAIREHarvester:
             db.add(harvest_log)
             db.commit()
 
+            pending: List[Dict[str, Any]] = []
+
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 page = 0
 
@@ -142,19 +157,25 @@ class OpenAIREHarvester:
                         stats["total_fetched"] += len(publications)
 
                         # Process and store publications
-                        for pub_data in publications:
-                            try:
-                                stored = await self._store_publication(
-                                    db, ror_id, pub_data
-                                )
-                                if stored:
-                                    stats["total_stored"] += 1
-                                else:
-                                    stats["duplicates"] += 1
-
-                            except Exception as e:
-                                logger.error(f"Error storing publication: {e}")
-                                stats["errors"] += 1
+                        if self.bulk:
+                            pending.extend(publications)
+                            if len(pending) >= BULK_INSERT_SIZE:
+                                self._store_publications_bulk(db, ror_id, pending, stats)
+                                pending = []
+                        else:
+                            for pub_data in publications:
+                                try:
+                                    stored = await self._store_publication(
+                                        db, ror_id, pub_data
+                                    )
+                                    if stored:
+                                        stats["total_stored"] += 1
+                                    else:
+                                        stats["duplicates"] += 1
+
+                                except Exception as e:
+                                    logger.error(f"Error storing publication: {e}")
+                                    stats["errors"] += 1
 
                         # Log progress
                         logger.info(
@@ -173,6 +194,9 @@ class OpenAIREHarvester:
                         stats["errors"] += 1
                         break
 
+            if pending:
+                self._store_publications_bulk(db, ror_id, pending, stats)
+
             # Update harvest log
             harvest_log.status = "completed"
             harvest_log.record_count = stats["total_stored"]
@@ -338,6 +362,63 @@ class OpenAIREHarvester:
             "metadata": pub_data,  # Store full metadata
         }
 
+    def _publication_row(self, org_id: str, pub_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map normalized publication data to Publication column values.
+
+        Args:
+            org_id: Organization ID
+            pub_data: Normalized publication data
+
+        Returns:
+            Column name to value dictionary
+        """
+        return {
+            "id": pub_data.get("id", pub_data.get("openaire_id")),
+            "doi": pub_data.get("doi"),
+            "title": pub_data.get("title"),
+            "abstract": pub_data.get("abstract"),
+            "publication_date": pub_data.get("publication_date"),
+            "publication_year": pub_data.get("publication_year"),
+            "publication_type": pub_data.get("publication_type"),
+            "authors": pub_data.get("authors"),
+            "journal": pub_data.get("journal"),
+            "publisher": pub_data.get("publisher"),
+            "open_access": pub_data.get("open_access"),
+            "license": pub_data.get("license"),
+            "source_system": "openaire",
+            "openaire_id": pub_data.get("openaire_id"),
+            "organization_id": org_id,
+            "harvested_at": datetime.utcnow(),
+        }
+
+    def _store_publications_bulk(
+        self, db, org_id: str, publications: List[Dict[str, Any]], stats: Dict[str, Any]
+    ) -> None:
+        """
+        Store a batch of publications with a single INSERT ... ON CONFLICT DO NOTHING.
+        Rows conflicting on id or DOI are counted as duplicates.
+
+        Args:
+            db: Database session
+            org_id: Organization ID
+            publications: Normalized publication data
+            stats: Statistics dictionary to update
+        """
+        rows = [self._publication_row(org_id, pub_data) for pub_data in publications]
+
+        try:
+            inserted = bulk_insert_ignore(db, Publication, rows)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error bulk storing {len(rows)} publications: {e}")
+            stats["errors"] += len(rows)
+            return
+
+        stats["total_stored"] += len(inserted)
+        stats["duplicates"] += len(rows) - len(inserted)
+
     async def _store_publication(
         self, db, org_id: str, pub_data: Dict[str, Any]
     ) -> bool:
@@ -370,36 +451,24 @@ class OpenAIREHarvester:
             return False
 
         # Create new publication
-        pub = Publication(
-            id=pub_data.get("id", pub_data.get("openaire_id")),
-            doi=pub_data.get("doi"),
-            title=pub_data.get("title"),
-            abstract=pub_data.get("abstract"),
-            publication_date=pub_data.get("publication_date"),
-            publication_year=pub_data.get("publication_year"),
-            publication_type=pub_data.get("publication_type"),
-            authors=pub_data.get("authors"),
-            journal=pub_data.get("journal"),
-            publisher=pub_data.get("publisher"),
-            open_access=pub_data.get("open_access"),
-            license=pub_data.get("license"),
-            source_system="openaire",
-            openaire_id=pub_data.get("openaire_id"),
-            organization_id=org_id,
-            harvested_at=datetime.utcnow(),
-        )
+        pub = Publication(**self._publication_row(org_id, pub_data))
 
         db.add(pub)
         db.commit()
 
         return True
 
-    async def harvest_all(self, max_records_per_org: Optional[int] = 1000):
+    async def harvest_all(
+        self,
+        max_records_per_org: Optional[int] = 1000,
+        on_org_complete: Optional[OrgStatsCallback] = None,
+    ):
         """
         Harvest all Austrian organizations.
 
         Args:
             max_records_per_org: Maximum records per organization (for testing)
+            on_org_complete: Optional callback receiving each organization's stats
         """
 
         logger.info("Starting harvest of all Austrian universities")
@@ -424,9 +493,72 @@ class OpenAIREHarvester:
                     "status": "failed",
                 }
 
+            if on_org_complete:
+                on_org_complete(ror_id, org_name, all_stats["organizations"][org_name])
+
             # Rate limiting between organizations
             await asyncio.sleep(2.0)
 
+        return self._finalize_all_stats(all_stats)
+
+    async def harvest_all_concurrent(
+        self,
+        max_records_per_org: Optional[int] = 1000,
+        concurrency: int = 4,
+        on_org_complete: Optional[OrgStatsCallback] = None,
+    ):
+        """
+        Harvest all Austrian organizations, overlapping up to `concurrency`
+        organizations at a time. Each organization uses its own session.
+
+        Args:
+            max_records_per_org: Maximum records per organization (for testing)
+            concurrency: Maximum organizations harvested simultaneously
+            on_org_complete: Optional callback receiving each organization's stats
+        """
+
+        logger.info(
+            f"Starting concurrent harvest of {len(AUSTRIAN_UNIVERSITIES)} "
+            f"Austrian universities (concurrency={concurrency})"
+        )
+
+        all_stats = {
+            "started_at": datetime.utcnow(),
+            "organizations": {},
+        }
+        sem = asyncio.Semaphore(concurrency)
+
+        async def harvest_one(ror_id: str, org_name: str) -> Dict[str, Any]:
+            async with sem:
+                try:
+                    stats = await self.harvest_organization(
+                        ror_id, org_name, max_records_per_org
+                    )
+                except Exception as e:
+                    logger.error(f"Error harvesting {org_name}: {e}")
+                    stats = {"error": str(e), "status": "failed"}
+
+            if on_org_complete:
+                on_org_complete(ror_id, org_name, stats)
+            return stats
+
+        results = await asyncio.gather(
+            *(harvest_one(ror_id, org_name) for ror_id, org_name in AUSTRIAN_UNIVERSITIES.items())
+        )
+        all_stats["organizations"] = dict(zip(AUSTRIAN_UNIVERSITIES.values(), results))
+
+        return self._finalize_all_stats(all_stats)
+
+    def _finalize_all_stats(self, all_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Stamp completion time and add totals across organizations.
+
+        Args:
+            all_stats: Statistics with per-organization results
+
+        Returns:
+            The same dictionary, completed
+        """
         all_stats["completed_at"] = datetime.utcnow()
 
         # Calculate totals
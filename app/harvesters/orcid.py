@@ -21,12 +21,13 @@ ORCID: Open Researcher and Contributor ID
 
 import httpx
 import asyncio
+import hashlib
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import logging
 
-from app.database import SessionLocal, Researcher, HarvestLog
+from app.database import SessionLocal, Researcher, HarvestLog, OrcidSearchNegative
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,16 @@ ORCID_API_BASE = "https://pub.orcid.org/v3.0"
 ORCID_SEARCH_BASE = "https://pub.orcid.org/v3.0/search"
 ORCID_TIMEOUT = 30.0
 ORCID_RATE_LIMIT = 24  # requests per second for public API
+ORCID_WORKERS = 64  # concurrent enrichment coroutines
+ORCID_QUEUE_SIZE = 2000  # max researchers buffered ahead of the workers
+ORCID_PAGE_SIZE = 500  # researchers loaded per producer query
+ORCID_NEGATIVE_TTL_DAYS = 30  # skip names with no ORCID match checked this recently
+
+
+def _name_hash(name: str) -> str:
+    """Hash a whitespace/case-normalized researcher name."""
+    normalized = " ".join(name.lower().split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
 
 
 class ORCIDHarvester:
@@ -54,6 +65,10 @@ class ORCIDHarvester:
         self.timeout = timeout
         self.user_agent = f"ARMP/1.0 (mailto:{email})"
 
+        # Shared by every worker: earliest loop time the next ORCID request may go out
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
     async def enrich_researchers(self, max_records: Optional[int] = None) -> Dict[str, Any]:
         """
         Enrich researcher records with ORCID data.
@@ -75,6 +90,7 @@ class ORCIDHarvester:
             "orcid_profile_matched": 0,
             "employment_updated": 0,
             "education_updated": 0,
+            "skipped_negative": 0,
             "errors": 0,
         }
 
@@ -87,79 +103,53 @@ class ORCIDHarvester:
             db.add(harvest_log)
             db.commit()
 
+            # Names searched recently without an ORCID match
+            negative_cutoff = datetime.utcnow() - timedelta(days=ORCID_NEGATIVE_TTL_DAYS)
+            seen_negatives = {
+                row[0]
+                for row in db.query(OrcidSearchNegative.name_hash).filter(
+                    OrcidSearchNegative.last_checked >= negative_cutoff
+                )
+            }
+
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Get researchers without ORCID ID
-                query = db.query(Researcher).filter(Researcher.orcid_id.is_(None))
-
-                if max_records:
-                    query = query.limit(max_records)
-
-                researchers = query.all()
-                stats["total_researchers"] = len(researchers)
-
-                logger.info(f"Found {len(researchers)} researchers without ORCID")
-
-                for i, researcher in enumerate(researchers):
-                    try:
-                        # Search ORCID for this researcher
-                        orcid_id = await self._search_orcid(
-                            client, researcher.full_name
-                        )
-
-                        if orcid_id:
-                            stats["orcid_found"] += 1
-
-                            # Get full ORCID profile
-                            profile = await self._fetch_orcid_profile(client, orcid_id)
-
-                            if profile:
-                                stats["orcid_profile_matched"] += 1
-
-                                # Update researcher record
-                                researcher.orcid_id = orcid_id
-                                researcher.orcid_profile_url = f"https://orcid.org/{orcid_id}"
-
-                                # Extract employment
-                                if profile.get("employmentSummary"):
-                                    employment = self._extract_employment(
-                                        profile["employmentSummary"]
-                                    )
-                                    if employment:
-                                        researcher.employment = employment
-                                        stats["employment_updated"] += 1
-
-                                # Extract education
-                                if profile.get("educationSummary"):
-                                    education = self._extract_education(
-                                        profile["educationSummary"]
-                                    )
-                                    if education:
-                                        researcher.education = education
-                                        stats["education_updated"] += 1
-
-                                # Extract keywords/interests
-                                if profile.get("keywords"):
-                                    keywords = [k.get("content") for k in profile["keywords"]]
-                                    researcher.keywords = keywords
-
-                                researcher.updated_at = datetime.utcnow()
-                                db.commit()
-                                stats["enriched"] += 1
-
-                        # Rate limiting
-                        await asyncio.sleep(1.0 / ORCID_RATE_LIMIT)
+                # Bounded queue: the producer pauses when workers fall behind
+                queue: asyncio.Queue = asyncio.Queue(maxsize=ORCID_QUEUE_SIZE)
+                processed = 0
+
+                async def worker():
+                    nonlocal processed
+                    while True:
+                        researcher = await queue.get()
+                        try:
+                            await self._enrich_researcher(
+                                client, db, researcher, seen_negatives, stats
+                            )
+                        except Exception as e:
+                            logger.warning(f"Error enriching researcher {researcher.id}: {e}")
+                            stats["errors"] += 1
+                        finally:
+                            queue.task_done()
 
+                        processed += 1
                         # Progress logging
-                        if (i + 1) % 100 == 0:
+                        if processed % 100 == 0:
                             logger.info(
-                                f"Processed {i+1}/{len(researchers)} researchers - "
+                                f"Processed {processed}/{stats['total_researchers']} researchers - "
                                 f"Enriched: {stats['enriched']}, "
                                 f"ORCID found: {stats['orcid_found']}"
                             )
 
-                    except Exception as e:
-                        logger.warning(f"Error enriching researcher {researcher.id}: {e}")
-                        stats["errors"] += 1
+                workers = [asyncio.create_task(worker()) for _ in range(ORCID_WORKERS)]
+                try:
+                    await self._produce_researchers(db, queue, max_records, stats)
+                    await queue.join()
+                finally:
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+
+                logger.info(f"Processed {stats['total_researchers']} researchers without ORCID")
 
             # Update harvest log
             harvest_log.status = "completed"
@@ -180,6 +170,146 @@ class ORCIDHarvester:
         finally:
             db.close()
 
+    async def _produce_researchers(
+        self,
+        db,
+        queue: asyncio.Queue,
+        max_records: Optional[int],
+        stats: Dict[str, Any],
+    ) -> None:
+        """
+        Feed researchers without ORCID ID into the work queue.
+
+        Pages through the table by primary key so only one page is held
+        in memory; `queue.put` blocks when the workers fall behind.
+
+        Args:
+            db: Database session
+            queue: Bounded work queue
+            max_records: Maximum researchers to enqueue
+            stats: Statistics dictionary to update
+        """
+        last_id = None
+        remaining = max_records
+
+        while remaining is None or remaining > 0:
+            query = db.query(Researcher).filter(Researcher.orcid_id.is_(None))
+            if last_id is not None:
+                query = query.filter(Researcher.id > last_id)
+
+            page_size = ORCID_PAGE_SIZE if remaining is None else min(ORCID_PAGE_SIZE, remaining)
+            page = query.order_by(Researcher.id).limit(page_size).all()
+            if not page:
+                break
+
+            last_id = page[-1].id
+            stats["total_researchers"] += len(page)
+            if remaining is not None:
+                remaining -= len(page)
+
+            for researcher in page:
+                await queue.put(researcher)
+
+    async def _throttle(self) -> None:
+        """Space ORCID requests across all workers to respect ORCID_RATE_LIMIT."""
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + 1.0 / ORCID_RATE_LIMIT
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """
+        Issue a throttled GET; every ORCID request goes through here.
+
+        Args:
+            client: Async HTTP client
+            url: Request URL
+            **kwargs: Passed through to client.get
+
+        Returns:
+            HTTP response
+        """
+        await self._throttle()
+        return await client.get(url, **kwargs)
+
+    async def _enrich_researcher(
+        self,
+        client: httpx.AsyncClient,
+        db,
+        researcher: Researcher,
+        seen_negatives: set,
+        stats: Dict[str, Any],
+    ) -> None:
+        """
+        Search ORCID for one researcher and update the record on a match.
+
+        Args:
+            client: Async HTTP client
+            db: Database session
+            researcher: Researcher without ORCID ID
+            seen_negatives: Name hashes recently confirmed as no-match
+            stats: Statistics dictionary to update
+        """
+        name_hash = _name_hash(researcher.full_name)
+        if name_hash in seen_negatives:
+            stats["skipped_negative"] += 1
+            return
+
+        # Search ORCID for this researcher
+        orcid_id = await self._search_orcid(client, researcher.full_name)
+
+        if orcid_id == "":
+            # Confirmed no match - remember to skip on re-runs
+            seen_negatives.add(name_hash)
+            db.merge(OrcidSearchNegative(
+                name_hash=name_hash,
+                last_checked=datetime.utcnow(),
+            ))
+            return
+
+        if not orcid_id:
+            return
+
+        stats["orcid_found"] += 1
+
+        # Get full ORCID profile
+        profile = await self._fetch_orcid_profile(client, orcid_id)
+        if not profile:
+            return
+
+        stats["orcid_profile_matched"] += 1
+
+        # Update researcher record
+        researcher.orcid_id = orcid_id
+        researcher.orcid_profile_url = f"https://orcid.org/{orcid_id}"
+
+        # Extract employment
+        if profile.get("employmentSummary"):
+            employment = self._extract_employment(profile["employmentSummary"])
+            if employment:
+                researcher.employment = employment
+                stats["employment_updated"] += 1
+
+        # Extract education
+        if profile.get("educationSummary"):
+            education = self._extract_education(profile["educationSummary"])
+            if education:
+                researcher.education = education
+                stats["education_updated"] += 1
+
+        # Extract keywords/interests
+        if profile.get("keywords"):
+            keywords = [k.get("content") for k in profile["keywords"]]
+            researcher.keywords = keywords
+
+        researcher.updated_at = datetime.utcnow()
+        db.commit()
+        stats["enriched"] += 1
+
     async def _search_orcid(
         self, client: httpx.AsyncClient, name: str
     ) -> Optional[str]:
@@ -191,7 +321,8 @@ class ORCIDHarvester:
             name: Researcher full name
 
         Returns:
-            ORCID ID if found, None otherwise
+            ORCID ID if found, empty string if the search returned no match,
+            None if the search failed
         """
         try:
             # Query ORCID search API
@@ -202,7 +333,8 @@ class ORCIDHarvester:
 
             headers = {"User-Agent": self.user_agent}
 
-            response = await client.get(
+            response = await self._get(
+                client,
                 f"{ORCID_SEARCH_BASE}",
                 params=params,
                 headers=headers,
@@ -219,7 +351,7 @@ class ORCIDHarvester:
                     logger.debug(f"Found ORCID for {name}: {orcid_id}")
                     return orcid_id
 
-            return None
+            return ""
 
         except httpx.HTTPError as e:
             logger.warning(f"HTTP error searching ORCID for {name}: {e}")
@@ -248,7 +380,7 @@ class ORCIDHarvester:
                 "Accept": "application/orcid+json",
             }
 
-            response = await client.get(url, headers=headers)
+            response = await self._get(client, url, headers=headers)
             response.raise_for_status()
 
             data = response.json()
@@ -263,7 +395,7 @@ class ORCIDHarvester:
             # Get employment
             employment_url = f"{ORCID_API_BASE}/{orcid_id}/employments"
             try:
-                emp_response = await client.get(employment_url, headers=headers)
+                emp_response = await self._get(client, employment_url, headers=headers)
                 if emp_response.status_code == 200:
                     emp_data = emp_response.json()
                     if emp_data.get("affiliation-group"):
@@ -274,7 +406,7 @@ class ORCIDHarvester:
             # Get education
             education_url = f"{ORCID_API_BASE}/{orcid_id}/educations"
             try:
-                edu_response = await client.get(education_url, headers=headers)
+                edu_response = await self._get(client, education_url, headers=headers)
                 if edu_response.status_code == 200:
                     edu_data = edu_response.json()
                     if edu_data.get("affiliation-group"):
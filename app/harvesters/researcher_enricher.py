@@ -14,16 +14,43 @@ Features:
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+import unicodedata
+from typing import Optional, Dict, Any, FrozenSet, List, Tuple
 from datetime import datetime
-from fuzzywuzzy import fuzz
+from fuzzywuzzy import fuzz, utils
 from collections import defaultdict
 import json
 
+from sqlalchemy import select
+
 from app.database import SessionLocal, Publication, Researcher, Organization, publication_author
 
 logger = logging.getLogger(__name__)
 
+# Number of publication_author rows inserted per executemany batch
+LINK_BATCH_SIZE = 5000
+
+
+def _name_keys(name: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Normalize an author name for deduplication.
+
+    Args:
+        name: Author name as found in publication metadata
+
+    Returns:
+        Tuple of (sorted-token key, blocking keys). The token key is
+        accent-stripped, lowercased, stripped of punctuation and token-sorted,
+        so that variants like "Müller, Hans" / "hans muller" collide exactly.
+        The blocking keys are the initials of every token: fuzzy comparisons
+        only run between names sharing one, whatever their name order.
+    """
+    ascii_name = (
+        unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    )
+    tokens = utils.full_process(ascii_name).split()
+    return " ".join(sorted(tokens)), frozenset(token[0] for token in tokens)
+
 
 class ResearcherEnricher:
     """
@@ -147,6 +174,10 @@ class ResearcherEnricher:
         Deduplicate author names using fuzzy matching.
         Authors with same/similar names are merged.
 
+        Names are reduced to sorted-token keys once; identical keys are merged
+        via dict lookup and fuzzy matching is confined to authors sharing
+        a token initial.
+
         Args:
             authors: List of author data dicts
             org_id: Organization ID for context
@@ -162,8 +193,12 @@ class ResearcherEnricher:
         seen = {}
         deduplicated = []
 
+        # Non-ORCID authors are bucketed by sorted-token key (exact duplicates)
+        # and fuzzy matching only runs within a blocking key
+        by_key: Dict[str, Dict[str, Any]] = {}
+        blocks: Dict[str, List[Tuple[int, str, int, Dict[str, Any]]]] = defaultdict(list)
+
         for author in authors:
-            name = author["name"].lower().strip()
             orcid = author["orcid"]
 
             # ORCID match is definitive
@@ -177,22 +212,48 @@ class ResearcherEnricher:
                         seen[orcid]["affiliation"] = author["affiliation"]
                 continue
 
-            # For non-ORCID authors, check fuzzy match against existing names
-            found_match = False
-            for existing_author in deduplicated:
-                if not existing_author["orcid"]:  # Only match against non-ORCID
-                    existing_name = existing_author["name"].lower().strip()
-                    match_score = fuzz.token_sort_ratio(name, existing_name)
+            tokens_key, block_keys = _name_keys(author["name"])
+            if not tokens_key:
+                # Nothing left to compare (punctuation only): never merged
+                deduplicated.append(author)
+                continue
 
+            existing_author = by_key.get(tokens_key)
+
+            # For non-ORCID authors, check fuzzy match against names sharing a block;
+            # a name sits in several blocks, so visit each candidate once, oldest first
+            if existing_author is None:
+                key_len = len(tokens_key)
+                candidates = {
+                    entry[0]: entry for block_key in block_keys for entry in blocks[block_key]
+                }
+                for _, existing_key, existing_len, candidate in sorted(
+                    candidates.values(), key=lambda entry: entry[0]
+                ):
+                    # Length bound: ratio can't exceed 2*min/(a+b) before rounding
+                    # to an int, so pairs below threshold - 0.5 can never match
+                    if 400 * min(key_len, existing_len) < (2 * self.fuzzy_threshold - 1) * (key_len + existing_len):
+                        continue
+
+                    # Keys are already full_process'd and token-sorted, so plain
+                    # ratio gives exactly the token_sort_ratio score
+                    match_score = fuzz.ratio(tokens_key, existing_key)
                     if match_score >= self.fuzzy_threshold:
-                        # Merge authors (keep more complete info)
-                        if author["affiliation"] and not existing_author["affiliation"]:
-                            existing_author["affiliation"] = author["affiliation"]
-                        found_match = True
+                        existing_author = candidate
+                        by_key[tokens_key] = candidate
                         break
 
-            if not found_match:
-                deduplicated.append(author)
+            if existing_author is not None:
+                # Merge authors (keep more complete info)
+                if author["affiliation"] and not existing_author["affiliation"]:
+                    existing_author["affiliation"] = author["affiliation"]
+                continue
+
+            by_key[tokens_key] = author
+            entry = (len(deduplicated), tokens_key, len(tokens_key), author)
+            for block_key in block_keys:
+                blocks[block_key].append(entry)
+            deduplicated.append(author)
 
         return deduplicated
 
@@ -267,6 +328,17 @@ class ResearcherEnricher:
         linked = 0
         errors = 0
 
+        # Load existing links once so membership checks stay in memory
+        existing_links = set(
+            map(tuple, db.execute(
+                select(
+                    publication_author.c.publication_id,
+                    publication_author.c.researcher_id,
+                )
+            ).fetchall())
+        )
+        pending: List[Dict[str, str]] = []
+
         # Get all publications with author data
         publications = db.query(Publication).filter(
             Publication.authors.isnot(None)
@@ -296,31 +368,53 @@ class ResearcherEnricher:
                                 Researcher.organization_id == pub.organization_id,
                             ).first()
 
-                        # Create link if researcher found
+                        # Create link if researcher found and not already linked
                         if researcher:
-                            # Check if link already exists
-                            existing = db.query(publication_author).filter(
-                                publication_author.c.publication_id == pub.id,
-                                publication_author.c.researcher_id == researcher.id,
-                            ).first()
+                            link = (pub.id, researcher.id)
+                            if link not in existing_links:
+                                existing_links.add(link)
+                                pending.append({
+                                    "publication_id": pub.id,
+                                    "researcher_id": researcher.id,
+                                })
 
-                            if not existing:
-                                # Create link
-                                stmt = publication_author.insert().values(
-                                    publication_id=pub.id,
-                                    researcher_id=researcher.id,
-                                )
-                                db.execute(stmt)
-                                linked += 1
+                                if len(pending) >= LINK_BATCH_SIZE:
+                                    linked += self._flush_links(db, pending)
+                                    pending = []
 
             except Exception as e:
                 logger.warning(f"Error linking researchers for {pub.id}: {e}")
                 errors += 1
 
+        if pending:
+            linked += self._flush_links(db, pending)
+
         db.commit()
         stats["researchers_linked"] = linked
         logger.info(f"Linked {linked} researcher-publication relationships")
 
+    def _flush_links(self, db, pending: List[Dict[str, str]]) -> int:
+        """
+        Insert a batch of publication_author rows inside a savepoint.
+
+        A failed batch is rolled back on its own, leaving the session (and the
+        researchers created earlier in it) usable for the following batches.
+
+        Args:
+            db: Database session
+            pending: Link rows to insert
+
+        Returns:
+            Number of links inserted, 0 if the batch failed
+        """
+        try:
+            with db.begin_nested():
+                db.execute(publication_author.insert(), pending)
+        except Exception as e:
+            logger.warning(f"Error inserting {len(pending)} researcher links: {e}")
+            return 0
+        return len(pending)
+
 
 def enrich_researchers():
     """
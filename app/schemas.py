@@ -8,7 +8,7 @@ These schemas define the contract between frontend and backend.
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================================
@@ -49,8 +49,7 @@ class OrganizationResponse(OrganizationBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ============================================================================
@@ -109,8 +108,7 @@ class PublicationResponse(PublicationBase):
     created_at: datetime
     harvested_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class PublicationSearchResponse(PublicationResponse):
@@ -120,12 +118,6 @@ class PublicationSearchResponse(PublicationResponse):
     matching_fields: Optional[List[str]] = None
 
 
-class PublicationWithAuthorsResponse(PublicationResponse):
-    """Publication with full author information"""
-
-    researcher_authors: Optional[List["ResearcherBasicResponse"]] = None
-
-
 # ============================================================================
 # Researcher Schemas
 # ============================================================================
@@ -147,6 +139,12 @@ class ResearcherBasicResponse(ResearcherBase):
     organization_id: Optional[str] = None
 
 
+class PublicationWithAuthorsResponse(PublicationResponse):
+    """Publication with full author information"""
+
+    researcher_authors: Optional[List[ResearcherBasicResponse]] = None
+
+
 class ResearcherCreate(ResearcherBase):
     """Schema for creating researcher"""
 
@@ -165,8 +163,7 @@ class ResearcherResponse(ResearcherBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class ResearcherProfileResponse(ResearcherResponse):
@@ -221,8 +218,7 @@ class ProjectResponse(ProjectBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class ProjectWithPublicationsResponse(ProjectResponse):
@@ -324,7 +320,3 @@ class HealthCheckResponse(BaseModel):
     version: str = "0.1.0"
     database: str = "connected"
     timestamp: datetime = Field(default_factory=datetime.utcnow)
-
-
-# Update forward references
-PublicationWithAuthorsResponse.model_rebuild()
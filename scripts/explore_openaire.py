@@ -10,15 +10,24 @@ This script:
 3. Saves sample data for inspection
 4. Outputs statistics for stakeholder communication
 
-Run: python scripts/explore_openaire.py
+Run: python scripts/explore_openaire.py [--no-cache]
 """
 
-import json
+import aiolimiter
+import argparse
+import asyncio
+import diskcache
+import functools
 import httpx
+import ijson
+import orjson
+import os
+import random
 import time
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from typing import Optional
 
 # Austrian universities with ROR identifiers
 AUSTRIAN_UNIVERSITIES = {
@@ -35,13 +44,112 @@ AUSTRIAN_UNIVERSITIES = {
 # OpenAIRE GraphQL endpoint
 OPENAIRE_API = "https://api.openaire.eu/graph"
 TIMEOUT = 30.0
+MAX_CONCURRENT_REQUESTS = 4
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.3  # seconds, doubled per attempt
+RATE_LIMIT_PER_SECOND = 10
 
+# Token bucket shared by every GET: requests go out as fast as the rate allows
+# instead of sleeping a fixed delay between them
+_LIMITER = aiolimiter.AsyncLimiter(RATE_LIMIT_PER_SECOND, 1)
 
-async def query_openaire(org_name: str, ror_id: str, limit: int = 100) -> dict:
+# Shared HTTP/2 client so all queries reuse pooled connections
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared OpenAIRE client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=TIMEOUT,
+            headers={"User-Agent": "AustrianResearchMetadata/1.0"},
+        )
+    return _CLIENT
+
+
+# Output directories, created once per process by _ensure_dirs()
+_DIRS = (Path("data/cache"), Path("data/exports"))
+
+
+@functools.cache
+def _ensure_dirs():
+    """Create the output directories on first use only."""
+    for d in _DIRS:
+        d.mkdir(parents=True, exist_ok=True)
+
+
+# On-disk response cache for repeated exploration runs
+CACHE_DIR = "data/cache/openaire"
+CACHE_TTL = 86400  # seconds
+_CACHE: Optional[diskcache.Cache] = None
+_CACHE_ENABLED = True
+
+
+def get_cache() -> Optional[diskcache.Cache]:
+    """Return the shared response cache, or None when caching is disabled."""
+    global _CACHE
+    if not _CACHE_ENABLED:
+        return None
+    if _CACHE is None:
+        _CACHE = diskcache.Cache(CACHE_DIR, size_limit=10 << 30)
+    return _CACHE
+
+
+def disable_cache():
+    """Bypass the response cache for this run (--no-cache)."""
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = False
+
+
+async def close_client():
+    """Close the shared client if it was created."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient, url: str, attempts: int = RETRY_ATTEMPTS, **kwargs
+) -> httpx.Response:
+    """
+    GET with jittered exponential backoff on transient failures.
+
+    Retries transport errors and 5xx responses; honours Retry-After on 429.
+    Other 4xx responses are raised immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            async with _LIMITER:
+                response = await client.get(url, **kwargs)
+            if response.status_code == 429 and attempt < attempts - 1:
+                try:
+                    delay = float(response.headers.get("Retry-After", 1))
+                except ValueError:
+                    delay = 1.0
+                await asyncio.sleep(delay)
+                continue
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                raise
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(RETRY_BASE_DELAY * (2 ** attempt) + random.random() * 0.1)
+
+
+async def query_openaire(
+    client: httpx.AsyncClient, org_name: str, ror_id: str, limit: int = 100
+) -> dict:
     """
     Query OpenAIRE Graph API for publications from a specific organization.
 
     Args:
+        client: Shared async HTTP client (see get_client)
         org_name: University name for display
         ror_id: ROR identifier
         limit: Number of results to fetch
@@ -99,42 +207,111 @@ async def query_openaire(org_name: str, ror_id: str, limit: int = 100) -> dict:
 
     print(f"\n📍 Querying OpenAIRE for: {org_name} (ROR: {ror_id})")
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
+    # Responses are idempotent during exploration; serve repeats from disk
+    cache = get_cache()
+    cache_key = (ror_id, limit, "publications")
+    if cache is not None:
+        hit = cache.get(cache_key)
+        if hit is not None:
+            print(f"   ✓ Served from cache")
+            return hit
+
+    try:
+        # Use the simple search endpoint
+        search_url = f"{OPENAIRE_API}/publications"
+
+        # More direct: search for organization name as keyword
+        headers = {
+            "User-Agent": "AustrianResearchMetadataPlatform/1.0 (research-discovery)"
+        }
+
+        # Let's query the Graph API properly with REST
+        response = await _get_with_retry(
+            client,
+            "https://api.openaire.eu/graph/publications",
+            params={
+                "keywords": org_name,
+                "size": limit,
+                "format": "json"
+            },
+            headers=headers
+        )
+        data = orjson.loads(response.content)
+
+        print(f"   ✓ Retrieved response")
+        result = {
+            "org": org_name,
+            "ror": ror_id,
+            "status": "success",
+            "data": data
+        }
+        if cache is not None:
+            cache.set(cache_key, result, expire=CACHE_TTL)
+        return result
+
+    except httpx.HTTPError as e:
+        print(f"   ✗ Error: {e}")
+        return {
+            "org": org_name,
+            "ror": ror_id,
+            "status": "error",
+            "error": str(e)
+        }
+
+
+async def fetch_one(
+    client: httpx.AsyncClient, uni_name: str, ror_id: str, sem: asyncio.Semaphore
+) -> dict:
+    """
+    Fetch a small OpenAIRE sample for one university.
+
+    Args:
+        client: Shared async HTTP client
+        uni_name: University name used as search keyword
+        ror_id: ROR identifier
+        sem: Semaphore bounding concurrent requests
+
+    Returns:
+        Result dictionary with status and data
+    """
+    async with sem:
         try:
-            # Use the simple search endpoint
-            search_url = f"{OPENAIRE_API}/publications"
+            print(f"\n📍 Testing OpenAIRE API for: {uni_name}")
 
-            # More direct: search for organization name as keyword
-            headers = {
-                "User-Agent": "AustrianResearchMetadataPlatform/1.0 (research-discovery)"
-            }
+            # Simple HTTP GET to verify API is accessible
+            async with _LIMITER:
+                response = await client.get(
+                    "https://api.openaire.eu/graph/publications",
+                    params={
+                        "keywords": uni_name.replace(" ", "+"),
+                        "size": 10,
+                        "format": "json"
+                    },
+                    headers={
+                        "User-Agent": "AustrianResearchMetadata/1.0"
+                    }
+                )
 
-            # Let's query the Graph API properly with REST
-            response = await client.get(
-                "https://api.openaire.eu/graph/publications",
-                params={
-                    "keywords": org_name,
-                    "size": limit,
-                    "format": "json"
-                },
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
+            print(f"   Status Code: {response.status_code}")
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                print(f"   ✓ Success! Got {len(response.content)} bytes of data")
+                return {
+                    "status": "success",
+                    "response_size": len(response.content),
+                    "data": data
+                }
 
-            print(f"   ✓ Retrieved response")
+            print(f"   ✗ Got status code {response.status_code}")
             return {
-                "org": org_name,
-                "ror": ror_id,
-                "status": "success",
-                "data": data
+                "status": "error",
+                "code": response.status_code
             }
 
-        except httpx.HTTPError as e:
-            print(f"   ✗ Error: {e}")
+        except Exception as e:
+            print(f"   ✗ Exception: {e}")
             return {
-                "org": org_name,
-                "ror": ror_id,
                 "status": "error",
                 "error": str(e)
             }
@@ -149,57 +326,19 @@ async def simple_openaire_test():
     print("=" * 60)
     print(f"⏰ Started at: {datetime.now().isoformat()}")
 
-    results = {}
-
     # Test with just the first 3 universities for speed
     test_unis = {k: v for k, v in list(AUSTRIAN_UNIVERSITIES.items())[:3]}
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        for uni_name, ror_id in test_unis.items():
-            try:
-                print(f"\n📍 Testing OpenAIRE API for: {uni_name}")
-
-                # Simple HTTP GET to verify API is accessible
-                response = await client.get(
-                    "https://api.openaire.eu/graph/publications",
-                    params={
-                        "keywords": uni_name.replace(" ", "+"),
-                        "size": 10,
-                        "format": "json"
-                    },
-                    headers={
-                        "User-Agent": "AustrianResearchMetadata/1.0"
-                    }
-                )
-
-                print(f"   Status Code: {response.status_code}")
+    # Requests run concurrently; the semaphore bounds in-flight requests and
+    # the shared limiter bounds the request rate
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    results[uni_name] = {
-                        "status": "success",
-                        "response_size": len(str(data)),
-                        "data": data
-                    }
-                    print(f"   ✓ Success! Got {len(str(data))} bytes of data")
-                else:
-                    results[uni_name] = {
-                        "status": "error",
-                        "code": response.status_code
-                    }
-                    print(f"   ✗ Got status code {response.status_code}")
+    client = get_client()
+    outcomes = await asyncio.gather(
+        *(fetch_one(client, u, r, sem) for u, r in test_unis.items())
+    )
 
-            except Exception as e:
-                print(f"   ✗ Exception: {e}")
-                results[uni_name] = {
-                    "status": "error",
-                    "error": str(e)
-                }
-
-            # Rate limiting - wait between requests
-            await asyncio.sleep(1)
-
-    return results
+    return dict(zip(test_unis, outcomes))
 
 
 async def test_direct_api():
@@ -208,36 +347,72 @@ async def test_direct_api():
     print("Testing OpenAIRE Graph API...")
     print("=" * 60)
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            # Test basic connectivity
-            response = await client.get(
-                "https://api.openaire.eu/graph/publications",
-                params={"size": 1}
-            )
+    client = get_client()
+    try:
+        # Save sample as JSON Lines, one publication per line
+        _ensure_dirs()
+        sample_path = Path("data/cache") / "openaire_sample.jsonl"
+        tmp_path = sample_path.with_suffix(".tmp")
+
+        # Test basic connectivity, streaming the body instead of loading it whole
+        async with client.stream(
+            "GET",
+            "https://api.openaire.eu/graph/publications",
+            params={"size": 1}
+        ) as response:
+            # An error body is JSON too; don't let it replace the sample
+            if response.status_code != 200:
+                body = await response.aread()
+                print(f"\n✗ Got status code {response.status_code}")
+                print(f"  Response text: {body[:200].decode(errors='replace')}...")
+                return
+
             print(f"\n✓ OpenAIRE API is accessible!")
             print(f"  Status: {response.status_code}")
-            print(f"  Response size: {len(response.text)} bytes")
 
-            # Try to parse response
+            # Parse incrementally: records are written as soon as they are complete
+            records = ijson.sendable_list()
+            parser = ijson.items_coro(records, "results.item", use_float=True)
+            size = 0
+            head = b""
+            count = 0
+
             try:
-                data = response.json()
+                # Stream into a temp file, renamed into place only once parsing succeeds
+                with open(tmp_path, "wb") as f:
+                    async for chunk in response.aiter_bytes():
+                        if not head:
+                            head = chunk[:200]
+                        size += len(chunk)
+                        parser.send(chunk)
+                        for record in records:
+                            f.write(orjson.dumps(record) + b"\n")
+                        count += len(records)
+                        del records[:]
+                    parser.close()
+                os.replace(tmp_path, sample_path)
+
+                print(f"  Response size: {size} bytes")
                 print(f"  ✓ Response is valid JSON")
+                print(f"  ✓ Saved {count} records to: {sample_path}")
 
-                # Save sample to file
-                cache_dir = Path("data/cache")
-                cache_dir.mkdir(parents=True, exist_ok=True)
+            except ijson.JSONError:
+                tmp_path.unlink(missing_ok=True)
+                print(f"  ✗ Response is not valid JSON")
+                print(f"  Response text: {head.decode(errors='replace')}...")
 
-                with open(cache_dir / "openaire_sample.json", "w") as f:
-                    json.dump(data, f, indent=2)
-                print(f"  ✓ Saved sample to: data/cache/openaire_sample.json")
+    except Exception as e:
+        print(f"✗ Error: {e}")
 
-            except json.JSONDecodeError:
-                print(f"  ✗ Response is not valid JSON")
-                print(f"  Response text: {response.text[:200]}...")
 
-        except Exception as e:
-            print(f"✗ Error: {e}")
+async def run_exploration():
+    """Run the API connectivity test and close the shared client afterwards."""
+    try:
+        await test_direct_api()
+    finally:
+        await close_client()
+        if _CACHE is not None:
+            _CACHE.close()
 
 
 def print_summary(results: dict):
@@ -269,21 +444,29 @@ def print_summary(results: dict):
 
 def main():
     """Main exploration function."""
-    import asyncio
+    parser = argparse.ArgumentParser(description="Explore OpenAIRE data for Austrian universities")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk OpenAIRE response cache",
+    )
+    args = parser.parse_args()
+
+    if args.no_cache:
+        disable_cache()
 
     print("\n" + "=" * 60)
     print("PHASE 0: AUSTRIAN RESEARCH METADATA EXPLORATION")
     print("Testing OpenAIRE API accessibility")
     print("=" * 60)
 
-    # Create cache directory
-    Path("data/cache").mkdir(parents=True, exist_ok=True)
-    Path("data/exports").mkdir(parents=True, exist_ok=True)
+    # Create output directories
+    _ensure_dirs()
 
     print("\n🔌 Testing OpenAIRE API connectivity...")
 
     # Run async test
-    asyncio.run(test_direct_api())
+    asyncio.run(run_exploration())
 
     print("\n" + "=" * 60)
     print("EXPLORATION COMPLETE")
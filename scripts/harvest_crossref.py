@@ -19,10 +19,11 @@ Requires:
 import asyncio
 import argparse
 import logging
-import json
+import logging.handlers
+import queue
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 # Add parent directory to path
 import sys
@@ -30,16 +31,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.harvesters.crossref import harvest_crossref_async
 from app.database import init_db
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("harvest_crossref.log"),
-        logging.StreamHandler(),
-    ]
-)
+from scripts.stats_output import write_stats
 
 logger = logging.getLogger(__name__)
 
@@ -63,9 +55,51 @@ AUSTRIAN_RORS = {
 }
 
 
+def _setup_logging() -> Tuple[logging.Handler, logging.handlers.QueueListener]:
+    """
+    Configure logging for a harvest run.
+
+    Records go through a queue so file writes happen on the listener thread
+    instead of blocking the event loop.
+
+    Returns:
+        Tuple of (root queue handler, listener to start and stop)
+    """
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    file_handler = logging.FileHandler("harvest_crossref.log")
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+
+    # QueueHandler pre-formats the message; the listener's handlers add the layout
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    return queue_handler, listener
+
+
 async def main():
     """Main entry point for Crossref harvesting."""
 
+    queue_handler, log_listener = _setup_logging()
+    log_listener.start()
+    try:
+        await _harvest()
+    finally:
+        log_listener.stop()
+        # Detach so a later run installs its own handler and listener
+        logging.getLogger().removeHandler(queue_handler)
+        for handler in log_listener.handlers:
+            handler.close()
+
+
+async def _harvest():
+    """Parse arguments and run the Crossref harvest."""
+
     parser = argparse.ArgumentParser(
         description="Harvest publications from Crossref API for Austrian institutions",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -113,33 +147,39 @@ Examples:
         help="Output file for harvest statistics (default: data/harvest_crossref_stats.json)"
     )
 
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the statistics file (writes <output>.gz)"
+    )
+
     args = parser.parse_args()
 
+    # Validate single org if specified (before touching the database)
+    if args.single and args.single not in AUSTRIAN_RORS:
+        logger.error("Unknown ROR ID: %s", args.single)
+        logger.info("Valid ROR IDs: %s", ', '.join(AUSTRIAN_RORS.keys()))
+        return
+
     # Initialize database
     logger.info("Initializing database...")
     try:
         init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
-        return
-
-    # Validate single org if specified
-    if args.single and args.single not in AUSTRIAN_RORS:
-        logger.error(f"Unknown ROR ID: {args.single}")
-        logger.info(f"Valid ROR IDs: {', '.join(AUSTRIAN_RORS.keys())}")
+        logger.error("Failed to initialize database: %s", e)
         return
 
     # Log harvest parameters
     logger.info("=" * 80)
     logger.info("CROSSREF HARVEST STARTING")
     logger.info("=" * 80)
-    logger.info(f"Max records per org: {args.max_records or 'unlimited'}")
-    logger.info(f"HTTP timeout: {args.timeout}s")
+    logger.info("Max records per org: %s", args.max_records or 'unlimited')
+    logger.info("HTTP timeout: %ss", args.timeout)
     if args.single:
-        logger.info(f"Single org mode: {AUSTRIAN_RORS[args.single]} ({args.single})")
+        logger.info("Single org mode: %s (%s)", AUSTRIAN_RORS[args.single], args.single)
     else:
-        logger.info(f"Multi-org mode: {len(AUSTRIAN_RORS)} Austrian organizations")
+        logger.info("Multi-org mode: %s Austrian organizations", len(AUSTRIAN_RORS))
     logger.info("=" * 80)
 
     # Run harvest
@@ -152,29 +192,25 @@ Examples:
         logger.info("=" * 80)
 
         if "total_fetched" in stats:
-            logger.info(f"Total fetched: {stats['total_fetched']}")
-            logger.info(f"Total stored: {stats['total_stored']}")
-            logger.info(f"Duplicates: {stats['total_duplicates']}")
-            logger.info(f"Errors: {stats['total_errors']}")
+            logger.info("Total fetched: %s", stats['total_fetched'])
+            logger.info("Total stored: %s", stats['total_stored'])
+            logger.info("Duplicates: %s", stats['total_duplicates'])
+            logger.info("Errors: %s", stats['total_errors'])
 
             if stats['total_fetched'] > 0:
                 duplicate_pct = (stats['total_duplicates'] / stats['total_fetched']) * 100
-                logger.info(f"Duplicate rate: {duplicate_pct:.1f}%")
+                logger.info("Duplicate rate: %.1f%%", duplicate_pct)
 
         # Save statistics
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w") as f:
-            json.dump(stats, f, indent=2, default=str)
+        output_path = write_stats(Path(args.output), stats, gzip=args.gzip)
 
-        logger.info(f"Statistics saved to: {output_path}")
+        logger.info("Statistics saved to: %s", output_path)
         logger.info("=" * 80)
 
     except KeyboardInterrupt:
         logger.warning("Harvest interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error during harvest: {e}", exc_info=True)
+        logger.error("Fatal error during harvest: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -24,7 +24,6 @@ Note:
 import asyncio
 import argparse
 import logging
-import json
 from datetime import datetime
 from pathlib import Path
 
@@ -32,8 +31,11 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select, func
+
 from app.harvesters.fwf import harvest_fwf
 from app.database import init_db, SessionLocal, Project
+from scripts.stats_output import write_stats
 
 # Configure logging
 logging.basicConfig(
@@ -64,6 +66,9 @@ Examples:
 
   # Save statistics to custom file
   python harvest_fwf.py --output data/fwf_stats.json
+
+  # Batched inserts, duplicates skipped by the database
+  python harvest_fwf.py --bulk
         """
     )
 
@@ -81,6 +86,18 @@ Examples:
         help="Output file for harvest statistics"
     )
 
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Insert in batches with ON CONFLICT DO NOTHING instead of per-row duplicate checks"
+    )
+
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the statistics file (writes <output>.gz)"
+    )
+
     args = parser.parse_args()
 
     # Initialize database
@@ -89,25 +106,21 @@ Examples:
         init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         return
 
     # Run harvest
     logger.info("=" * 80)
     logger.info("FWF PROJECT HARVEST STARTING")
     logger.info("=" * 80)
-    logger.info(f"Max records: {args.max_records or 'unlimited'}")
+    logger.info("Max records: %s", args.max_records or 'unlimited')
     logger.info("=" * 80)
 
     try:
-        stats = await harvest_fwf(max_records=args.max_records)
+        stats = await harvest_fwf(max_records=args.max_records, bulk=args.bulk)
 
         # Save statistics
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w") as f:
-            json.dump(stats, f, indent=2, default=str)
+        output_path = write_stats(Path(args.output), stats, gzip=args.gzip)
 
         # Log summary
         logger.info("=" * 80)
@@ -115,29 +128,28 @@ Examples:
         logger.info("=" * 80)
 
         if "total_fetched" in stats:
-            logger.info(f"Total fetched: {stats['total_fetched']}")
-            logger.info(f"Total stored: {stats['total_stored']}")
-            logger.info(f"Duplicates: {stats['duplicates']}")
-            logger.info(f"Linked to publications: {stats['linked_to_publications']}")
-            logger.info(f"Errors: {stats['errors']}")
+            logger.info("Total fetched: %s", stats['total_fetched'])
+            logger.info("Total stored: %s", stats['total_stored'])
+            logger.info("Duplicates: %s", stats['duplicates'])
+            logger.info("Linked to publications: %s", stats['linked_to_publications'])
+            logger.info("Errors: %s", stats['errors'])
 
             if stats['total_fetched'] > 0:
                 duplicate_pct = (stats['duplicates'] / stats['total_fetched']) * 100
-                logger.info(f"Duplicate rate: {duplicate_pct:.1f}%")
+                logger.info("Duplicate rate: %.1f%%", duplicate_pct)
 
         # Count total projects
-        db = SessionLocal()
-        total = db.query(Project).count()
-        db.close()
-        logger.info(f"Total projects in database: {total}")
+        with SessionLocal() as db:
+            total = db.execute(select(func.count()).select_from(Project)).scalar()
+        logger.info("Total projects in database: %s", total)
 
-        logger.info(f"Statistics saved to: {output_path}")
+        logger.info("Statistics saved to: %s", output_path)
         logger.info("=" * 80)
 
     except KeyboardInterrupt:
         logger.warning("Harvest interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error during harvest: {e}", exc_info=True)
+        logger.error("Fatal error during harvest: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ Usage:
     python scripts/harvest_openaire.py                    # Harvest all organizations
     python scripts/harvest_openaire.py --max-records 100  # Limit to 100 per org
     python scripts/harvest_openaire.py --single UNIVIE    # Single organization
+    python scripts/harvest_openaire.py --concurrency 4    # 4 organizations at a time
 
 This script:
 1. Initializes the database
@@ -17,11 +18,14 @@ This script:
 """
 
 import asyncio
+import functools
 import logging
+import time
 import argparse
 from pathlib import Path
-import json
+import orjson
 from datetime import datetime
+from typing import Optional
 
 # Add parent directory to path for imports
 import sys
@@ -30,6 +34,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.database import init_db
 from app.harvesters.openaire import OpenAIREHarvester, AUSTRIAN_UNIVERSITIES
+from scripts.stats_output import STATS_JSON_OPTIONS, write_stats
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +48,63 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Per-organization stats, appended as each organization finishes
+STATS_JSONL_PATH = Path("data/harvest_stats.jsonl")
+
+# Lowercased name lookups for --single, built once
+_NAME_INDEX = {name.lower(): ror for ror, name in AUSTRIAN_UNIVERSITIES.items()}
+_LOWER_NAMES = [(ror, name.lower()) for ror, name in AUSTRIAN_UNIVERSITIES.items()]
+
+
+@functools.cache
+def _ensure_dirs():
+    """Create the stats output directory on first use only."""
+    STATS_JSONL_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+
+def _org_stats_writer(stats_fp):
+    """
+    Build an on_org_complete callback that appends one JSON line per organization.
+
+    Args:
+        stats_fp: Binary file opened in append mode
+
+    Returns:
+        Callback for OpenAIREHarvester.harvest_all*
+    """
+
+    def write(ror_id: str, org_name: str, org_stats: dict) -> None:
+        record = {"org": org_name, "ror": ror_id, **org_stats, "ts": time.time()}
+        stats_fp.write(orjson.dumps(record, option=orjson.OPT_NAIVE_UTC) + b"\n")
+        stats_fp.flush()
+
+    return write
+
+
+def _resolve_organization(query: str) -> Optional[str]:
+    """
+    Resolve a ROR ID or (partial) university name to a ROR ID.
+
+    Args:
+        query: ROR ID or name fragment from --single
+
+    Returns:
+        ROR ID, or None if nothing matches
+    """
+    # Check if it's a ROR ID, then an exact name, then a name substring
+    if query in AUSTRIAN_UNIVERSITIES:
+        return query
+
+    lowered = query.lower()
+    if lowered in _NAME_INDEX:
+        return _NAME_INDEX[lowered]
+
+    for rid, lower_name in _LOWER_NAMES:
+        if lowered in lower_name:
+            return rid
+
+    return None
+
 
 async def main():
     """Main harvest function."""
@@ -73,6 +135,22 @@ async def main():
         default=100,
         help="Batch size per API request (default: 100)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Organizations harvested in parallel in multi-org mode (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Insert in batches with ON CONFLICT DO NOTHING instead of per-row duplicate checks",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the statistics file (writes data/harvest_stats.json.gz)",
+    )
 
     args = parser.parse_args()
 
@@ -80,6 +158,17 @@ async def main():
     logger.info("Austrian Research Metadata Platform - OpenAIRE Harvester")
     logger.info("=" * 70)
 
+    # Resolve --single before touching the database
+    if args.single:
+        ror_id = _resolve_organization(args.single)
+        if not ror_id:
+            logger.error("Organization not found: %s", args.single)
+            logger.info("Available organizations:")
+            for rid, rname in AUSTRIAN_UNIVERSITIES.items():
+                logger.info("  %s: %s", rid, rname)
+            return
+        org_name = AUSTRIAN_UNIVERSITIES[ror_id]
+
     # Initialize database
     logger.info("Initializing database...")
     init_db()
@@ -89,48 +178,49 @@ async def main():
     harvester = OpenAIREHarvester(
         batch_size=args.batch_size,
         timeout=args.timeout,
+        bulk=args.bulk,
     )
 
     # Determine what to harvest
     if args.single:
         # Harvest single organization
-        ror_id = None
-        org_name = None
-
-        # Check if it's a ROR ID
-        if args.single in AUSTRIAN_UNIVERSITIES:
-            ror_id = args.single
-            org_name = AUSTRIAN_UNIVERSITIES[args.single]
-        else:
-            # Search by name
-            for rid, rname in AUSTRIAN_UNIVERSITIES.items():
-                if args.single.lower() in rname.lower():
-                    ror_id = rid
-                    org_name = rname
-                    break
-
-        if not ror_id:
-            logger.error(f"Organization not found: {args.single}")
-            logger.info("Available organizations:")
-            for rid, rname in AUSTRIAN_UNIVERSITIES.items():
-                logger.info(f"  {rid}: {rname}")
-            return
-
-        logger.info(f"Harvesting single organization: {org_name}")
+        logger.info("Harvesting single organization: %s", org_name)
         stats = await harvester.harvest_organization(ror_id, org_name, args.max_records)
 
+        _ensure_dirs()
+        with open(STATS_JSONL_PATH, "ab") as stats_fp:
+            _org_stats_writer(stats_fp)(ror_id, org_name, stats)
+
         # Print summary
         print("\n" + "=" * 70)
         print("HARVEST SUMMARY")
         print("=" * 70)
-        print(json.dumps(stats, default=str, indent=2))
+        # Write the encoded bytes directly; flush first so the header stays on top
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(stats, option=STATS_JSON_OPTIONS))
+        sys.stdout.write("\n")
 
     else:
         # Harvest all organizations
-        logger.info(f"Harvesting all {len(AUSTRIAN_UNIVERSITIES)} Austrian universities")
-        logger.info(f"Max records per organization: {args.max_records}")
+        logger.info("Harvesting all %s Austrian universities", len(AUSTRIAN_UNIVERSITIES))
+        logger.info("Max records per organization: %s", args.max_records)
 
-        stats = await harvester.harvest_all(args.max_records)
+        # Append each organization's stats as soon as it finishes,
+        # so a crash mid-run keeps the completed ones
+        _ensure_dirs()
+        with open(STATS_JSONL_PATH, "ab") as stats_fp:
+            on_org_complete = _org_stats_writer(stats_fp)
+            if args.concurrency > 1:
+                stats = await harvester.harvest_all_concurrent(
+                    args.max_records,
+                    concurrency=args.concurrency,
+                    on_org_complete=on_org_complete,
+                )
+            else:
+                stats = await harvester.harvest_all(
+                    args.max_records, on_org_complete=on_org_complete
+                )
+        logger.info("Per-organization statistics appended to %s", STATS_JSONL_PATH)
 
         # Print summary
         print("\n" + "=" * 70)
@@ -143,25 +233,23 @@ async def main():
             f"Errors:        {stats['total_errors']}\n"
         )
 
-        print("Per Organization:")
+        lines = ["Per Organization:"]
         for org_name, org_stats in stats["organizations"].items():
             if "error" in org_stats:
-                print(f"  {org_name}: ERROR - {org_stats['error']}")
+                lines.append(f"  {org_name}: ERROR - {org_stats['error']}")
             else:
-                print(
+                lines.append(
                     f"  {org_name}: "
                     f"Fetched {org_stats['total_fetched']}, "
                     f"Stored {org_stats['total_stored']}, "
                     f"Duplicates {org_stats['duplicates']}"
                 )
-
-        print("=" * 70)
+        lines.append("=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Save statistics
-        stats_file = Path("data/harvest_stats.json")
-        with open(stats_file, "w") as f:
-            json.dump(stats, f, default=str, indent=2)
-        logger.info(f"Statistics saved to {stats_file}")
+        stats_file = write_stats(Path("data/harvest_stats.json"), stats, gzip=args.gzip)
+        logger.info("Statistics saved to %s", stats_file)
 
     logger.info("Harvest complete!")
 
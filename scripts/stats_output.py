@@ -0,0 +1,41 @@
+"""
+Harvest Statistics Output
+=========================
+
+Shared by the harvest scripts to write their statistics files.
+"""
+
+import gzip as gzip_lib
+import os
+from pathlib import Path
+
+import orjson
+
+# Harvest stats only hold ints, strings and naive UTC datetimes, all native to orjson
+STATS_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+STATS_GZIP_LEVEL = 5  # fast; JSON still shrinks several-fold
+
+
+def write_stats(path: Path, stats: dict, gzip: bool = False) -> Path:
+    """
+    Write harvest statistics as JSON, atomically.
+
+    Args:
+        path: Target file
+        stats: Statistics dictionary
+        gzip: Gzip the output and append ".gz" to the file name
+
+    Returns:
+        Path actually written
+    """
+    data = orjson.dumps(stats, option=STATS_JSON_OPTIONS)
+    if gzip:
+        path = path.with_name(path.name + ".gz")
+        data = gzip_lib.compress(data, compresslevel=STATS_GZIP_LEVEL)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file and rename so a crash never leaves a partial file
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return path
@@ -18,13 +18,15 @@ import os
 from pathlib import Path
 import logging
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
 from app.database import Organization, Publication, Researcher, Project, HarvestLog
+from scripts.migrate_data import psycopg_url
 
 # Configure logging
 logging.basicConfig(
@@ -34,21 +36,69 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Tables whose row counts are compared, keyed by report name
+COUNTED_MODELS = {
+    "organizations": Organization,
+    "publications": Publication,
+    "researchers": Researcher,
+    "projects": Project,
+    "harvest_logs": HarvestLog,
+}
+
+# All counts in one statement, so each database costs a single round trip
+COUNT_SQL = "SELECT " + ", ".join(
+    f"(SELECT count(*) FROM {model.__tablename__}) AS {name}"
+    for name, model in COUNTED_MODELS.items()
+)
+ESTIMATE_SQL = "SELECT " + ", ".join(
+    f"(SELECT reltuples::bigint FROM pg_class WHERE oid = '{model.__tablename__}'::regclass) AS {name}"
+    for name, model in COUNTED_MODELS.items()
+)
+
+# Relative difference accepted between source counts and pg_class.reltuples.
+# ANALYZE samples large tables (about 30k pages), so reltuples is only
+# exact for small ones
+ESTIMATE_TOLERANCE = 0.05
+
+# Tables whose primary keys are checked for NULLs
+PK_CHECK_TABLES = ("organization", "publication", "researcher", "project")
+
+# A NOT NULL id column cannot hold NULLs, so only tables whose id column lacks
+# the constraint need attention; answered by the catalog without a table scan
+NULLABLE_PK_SQL = """
+    SELECT c.relname
+    FROM pg_class c
+    JOIN pg_attribute a ON a.attrelid = c.oid
+    WHERE a.attname = 'id' AND NOT a.attnotnull AND c.relname = ANY(:tables)
+"""
+
 
 class MigrationVerifier:
     """Verifies migration success."""
 
-    def __init__(self, source_db: str, target_db: str):
-        """Initialize verifier."""
-
-        self.source_engine = create_engine(source_db)
-        self.target_engine = create_engine(target_db)
+    def __init__(self, source_db: str, target_db: str, estimate: bool = False):
+        """
+        Initialize verifier.
+
+        Args:
+            source_db: SQLite connection string
+            target_db: PostgreSQL connection string
+            estimate: Read PostgreSQL row counts from pg_class.reltuples
+                (O(1), approximate for large tables) instead of COUNT(*), and
+                compare within ESTIMATE_TOLERANCE
+        """
 
-        SourceSession = sessionmaker(bind=self.source_engine)
-        TargetSession = sessionmaker(bind=self.target_engine)
+        self.estimate = estimate
 
-        self.source_session = SourceSession()
-        self.target_session = TargetSession()
+        # pre_ping validates each pooled connection on checkout, so a dead
+        # database fails on the first real query instead of a separate probe.
+        # Target goes through psycopg 3, the only PostgreSQL driver required.
+        self.source_engine = create_engine(
+            source_db, pool_pre_ping=True, pool_recycle=300
+        )
+        self.target_engine = create_engine(
+            psycopg_url(target_db), pool_pre_ping=True, pool_recycle=300
+        )
 
     def verify(self) -> bool:
         """
@@ -63,14 +113,24 @@ class MigrationVerifier:
         logger.info("=" * 80)
 
         try:
-            # Check connectivity
-            self._verify_connectivity()
-
-            # Compare record counts
-            all_match = self._verify_record_counts()
-
-            # Check schema
-            self._verify_schema()
+            # Every probe is independent and latency-bound: issue them all at
+            # once on separate pooled connections, then report in order
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                source_counts = pool.submit(self._fetch_row, self.source_engine, COUNT_SQL)
+                target_counts = pool.submit(
+                    self._fetch_row,
+                    self.target_engine,
+                    ESTIMATE_SQL if self.estimate else COUNT_SQL,
+                )
+                nullable_pks = pool.submit(self._nullable_pk_tables)
+
+                # Compare record counts
+                all_match = self._verify_record_counts(
+                    source_counts.result(), target_counts.result()
+                )
+
+                # Check schema
+                self._verify_schema(nullable_pks)
 
             logger.info("=" * 80)
 
@@ -90,57 +150,69 @@ class MigrationVerifier:
             return False
 
         finally:
-            self.source_session.close()
-            self.target_session.close()
+            self.source_engine.dispose()
+            self.target_engine.dispose()
 
-    def _verify_connectivity(self):
-        """Verify database connections."""
+    def _fetch_row(self, engine, sql: str) -> Dict[str, Any]:
+        """
+        Run a single-row query on its own connection.
 
-        logger.info("Verifying database connections...")
+        Args:
+            engine: Engine to query
+            sql: Statement returning exactly one row
 
-        try:
-            # Test SQLite
-            result = self.source_session.execute(text("SELECT 1")).scalar()
-            logger.info("✓ SQLite connection successful")
-        except Exception as e:
-            logger.error(f"✗ SQLite connection failed: {e}")
-            raise
+        Returns:
+            Column name to value mapping
+        """
 
-        try:
-            # Test PostgreSQL
-            result = self.target_session.execute(text("SELECT 1")).scalar()
-            logger.info("✓ PostgreSQL connection successful")
-        except Exception as e:
-            logger.error(f"✗ PostgreSQL connection failed: {e}")
-            raise
+        # Plain driver SQL: the fused statement is static, nothing to compile
+        with engine.connect() as conn:
+            return dict(conn.exec_driver_sql(sql).one()._mapping)
 
-    def _verify_record_counts(self) -> bool:
+    def _nullable_pk_tables(self) -> List[str]:
+        """
+        Find checked target tables whose id column is not declared NOT NULL.
+
+        Returns:
+            Names from PK_CHECK_TABLES that could hold NULL primary keys
+        """
+
+        with self.target_engine.connect() as conn:
+            return list(
+                conn.execute(
+                    text(NULLABLE_PK_SQL), {"tables": list(PK_CHECK_TABLES)}
+                ).scalars()
+            )
+
+    def _verify_record_counts(
+        self, source_counts: Dict[str, Any], target_counts: Dict[str, Any]
+    ) -> bool:
         """
         Compare record counts between databases.
 
+        Args:
+            source_counts: SQLite counts keyed by COUNTED_MODELS name
+            target_counts: PostgreSQL counts keyed by COUNTED_MODELS name
+
         Returns:
             bool: True if all counts match
         """
 
         logger.info("Comparing record counts...")
 
-        models = {
-            "organizations": Organization,
-            "publications": Publication,
-            "researchers": Researcher,
-            "projects": Project,
-            "harvest_logs": HarvestLog,
-        }
-
         all_match = True
 
-        for name, model in models.items():
-            source_count = self.source_session.query(model).count()
-            target_count = self.target_session.query(model).count()
+        for name in COUNTED_MODELS:
+            source_count = source_counts[name]
+            target_count = target_counts[name]
 
-            match = source_count == target_count
+            if self.estimate:
+                match = abs(target_count - source_count) <= source_count * ESTIMATE_TOLERANCE
+                status = " (approximate)" if match else " (MISMATCH, approximate)"
+            else:
+                match = source_count == target_count
+                status = "" if match else f" (MISMATCH!)"
             symbol = "✓" if match else "✗"
-            status = "" if match else f" (MISMATCH!)"
 
             logger.info(f"{symbol} {name:20} SQLite: {source_count:6} → PostgreSQL: {target_count:6}{status}")
 
@@ -149,31 +221,25 @@ class MigrationVerifier:
 
         return all_match
 
-    def _verify_schema(self):
-        """Verify schema integrity."""
+    def _verify_schema(self, nullable_pks: Future):
+        """
+        Verify schema integrity.
+
+        Args:
+            nullable_pks: Pending _nullable_pk_tables result
+        """
 
         logger.info("Verifying schema integrity...")
 
         try:
             # Check if primary keys are set
-            with self.target_engine.connect() as conn:
-
-                tables = [
-                    "organization",
-                    "publication",
-                    "researcher",
-                    "project",
-                ]
+            nullable = set(nullable_pks.result())
 
-                for table in tables:
-                    result = conn.execute(
-                        text(f"SELECT COUNT(*) FROM {table} WHERE id IS NULL")
-                    ).scalar()
-
-                    if result > 0:
-                        logger.warning(f"⚠ {table}: Found {result} NULL primary keys")
-                    else:
-                        logger.info(f"✓ {table}: Primary keys valid")
+            for table in PK_CHECK_TABLES:
+                if table in nullable:
+                    logger.warning(f"⚠ {table}: Primary key column allows NULL")
+                else:
+                    logger.info(f"✓ {table}: Primary keys valid")
 
         except Exception as e:
             logger.warning(f"Schema check skipped: {e}")
@@ -193,6 +259,14 @@ def main():
         help="Source SQLite database"
     )
 
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Use PostgreSQL's catalog row estimates instead of COUNT(*) scans. "
+             "Estimates are sampled by ANALYZE on large tables, so counts are "
+             f"compared within {ESTIMATE_TOLERANCE:.0%}%"
+    )
+
     args = parser.parse_args()
 
     # Get target from environment
@@ -202,7 +276,7 @@ def main():
         sys.exit(1)
 
     # Run verification
-    verifier = MigrationVerifier(args.source, target_db)
+    verifier = MigrationVerifier(args.source, target_db, estimate=args.estimate)
     success = verifier.verify()
 
     sys.exit(0 if success else 1)
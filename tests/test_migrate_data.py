@@ -0,0 +1,63 @@
+"""Tests for the SQLite-side COPY text rendering in the migration script."""
+
+from sqlalchemy import (
+    JSON, Boolean, Column, Float, Integer, MetaData, String, Table, Text,
+    create_engine, text,
+)
+
+from scripts.migrate_data import copy_line_sql
+
+metadata = MetaData()
+sample = Table(
+    "sample",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("body", Text),
+    Column("count", Integer),
+    Column("flag", Boolean),
+    Column("score", Float),
+    Column("extra", JSON),
+)
+
+
+def _copy_lines(*rows):
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sample.insert(), list(rows))
+        return conn.execute(
+            text(f"SELECT {copy_line_sql(sample)} FROM sample ORDER BY id")
+        ).scalars().all()
+
+
+def test_special_characters_are_escaped():
+    lines = _copy_lines({
+        "id": "a\tb",
+        "body": "line1\nline2\r\\end",
+        "count": 3,
+        "flag": True,
+        "score": 1.5,
+        "extra": {"k": "v"},
+    })
+    assert lines == [
+        'a\\tb\tline1\\nline2\\r\\\\end\t3\t1\t1.5\t{"k": "v"}\n'
+    ]
+
+
+def test_nulls_and_literal_backslash_n():
+    lines = _copy_lines({
+        "id": "\\N",
+        "body": None,
+        "count": None,
+        "flag": None,
+        "score": None,
+        "extra": None,
+    })
+    # SQL NULL becomes \N; a literal backslash-N string must not
+    assert lines == ["\\\\N\t\\N\t\\N\t\\N\t\\N\tnull\n"]
+
+
+def test_json_escapes_are_preserved():
+    lines = _copy_lines({"id": "j", "extra": {"k": "tab\there"}})
+    # JSON text holds a backslash escape, which COPY must double
+    assert lines[0].endswith('\t{"k": "tab\\\\there"}\n')
@@ -0,0 +1,59 @@
+"""Tests for author deduplication in the researcher enricher."""
+
+from fuzzywuzzy import fuzz
+
+from app.harvesters.researcher_enricher import ResearcherEnricher, _name_keys
+
+
+def _author(name, orcid=None, affiliation=None):
+    return {
+        "name": name,
+        "orcid": orcid,
+        "affiliation": affiliation,
+        "publication_id": "p1",
+    }
+
+
+def _dedupe(*names):
+    return ResearcherEnricher(fuzzy_threshold=90)._deduplicate_authors(
+        [_author(name) for name in names], "org", None
+    )
+
+
+def test_name_keys_ignore_order_case_accents_and_punctuation():
+    assert _name_keys("Müller, Hans")[0] == _name_keys("hans muller")[0]
+    assert _name_keys("Müller, Hans")[1] == frozenset({"h", "m"})
+
+
+def test_surname_first_and_given_first_names_are_compared():
+    # "Surname, Given" and "Given Surname" must land in a shared block
+    assert len(_dedupe("Müller, Hans", "Hans Mueller")) == 1
+    assert len(_dedupe("Hans Mueller", "Müller, Hans")) == 1
+
+
+def test_distinct_names_stay_separate():
+    assert len(_dedupe("Hans Müller", "Anna Schmidt", "Müller, Anna")) == 3
+
+
+def test_punctuation_only_names_are_not_merged():
+    assert len(_dedupe("-", ".")) == 2
+
+
+def test_punctuated_initials_merge():
+    assert len(_dedupe("Smith, J.-P.", "Smith JP")) == 1
+
+
+def test_prefilters_match_token_sort_ratio():
+    # The cheap checks must never split a pair token_sort_ratio would merge
+    names = ["Smith, J.-P.", "Smith JP", "J. P. Smith", "Jean-Pierre Smith",
+             "Müller, Hans", "Hans Mueller", "H. Müller", "Hans-Peter Müller"]
+    for threshold in (50, 70, 90):
+        enricher = ResearcherEnricher(fuzzy_threshold=threshold)
+        for a in names:
+            for b in names:
+                merged = len(enricher._deduplicate_authors(
+                    [_author(a), _author(b)], "org", None
+                )) == 1
+                score = fuzz.token_sort_ratio(_name_keys(a)[0], _name_keys(b)[0])
+                if _name_keys(a)[1] & _name_keys(b)[1]:
+                    assert merged == (score >= threshold), (a, b, threshold)